@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import types
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Concatenate
 
 from . import CONFIG_VERSION_2
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
 
     from homeassistant.data_entry_flow import FlowResult
 
@@ -140,9 +141,31 @@ class NullableNumberSelector(NumberSelector):
         return value
 
 
-def get_step_user_data_schema(hass: HomeAssistant) -> vol.Schema:
-    """Generate a static schema for the main menu to select services."""
-    schema = {
+def cached_schema[**P](
+    schema_func: Callable[Concatenate[HomeAssistant, P], Awaitable[vol.Schema]],
+) -> Callable[Concatenate[HomeAssistant, P], Awaitable[vol.Schema]]:
+    """Cache the schema built by a factory that does not depend on HA state."""
+    cache: dict[tuple, vol.Schema] = {}
+
+    @functools.wraps(schema_func)
+    async def wrapper(
+        hass: HomeAssistant, *args: P.args, **kwargs: P.kwargs
+    ) -> vol.Schema:
+        key = (args, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = await schema_func(hass, *args, **kwargs)
+        return cache[key]
+
+    return wrapper
+
+
+def options_to_selections_dict(opts: dict) -> list[SelectOptionDict]:
+    """Convert a dict to a list of select options."""
+    return [SelectOptionDict(value=key, label=opts[key]) for key in opts]
+
+
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
         vol.Optional(
             CONF_SEARCH_PROVIDER,
         ): SelectSelector(
@@ -158,13 +181,13 @@ def get_step_user_data_schema(hass: HomeAssistant) -> vol.Schema:
         vol.Optional(CONF_WEATHER_ENABLED, default=False): bool,
         vol.Optional(CONF_BASIC_UTILITIES_ENABLED, default=False): bool,
         vol.Optional(CONF_HOME_CONTROL_ENABLED, default=False): bool,
-    }
-    return vol.Schema(schema)
+    },
+)
 
 
-def options_to_selections_dict(opts: dict) -> list[SelectOptionDict]:
-    """Convert a dict to a list of select options."""
-    return [SelectOptionDict(value=key, label=opts[key]) for key in opts]
+def get_step_user_data_schema(hass: HomeAssistant) -> vol.Schema:
+    """Return the static schema for the main menu to select services."""
+    return STEP_USER_DATA_SCHEMA
 
 
 def expand_config_for_schema(config: dict) -> dict:
@@ -194,8 +217,10 @@ def merge_provider_api_keys_from_input(config_data: dict, user_input: dict) -> N
     config_data.pop(CONF_GOOGLE_API_KEY, None)
 
 
+@cached_schema
 async def get_brave_schema(
     hass: HomeAssistant,
+    *,
     is_llm_context_search: bool,
 ) -> vol.Schema:
     """Return the static schema for Brave service configuration."""
@@ -312,6 +337,7 @@ async def get_brave_schema(
     return vol.Schema(schema)
 
 
+@cached_schema
 async def get_searxng_schema(hass: HomeAssistant) -> vol.Schema:
     """Return the static schema for the SearXNG service configuration."""
     return vol.Schema(
@@ -336,6 +362,7 @@ async def get_searxng_schema(hass: HomeAssistant) -> vol.Schema:
     )
 
 
+@cached_schema
 async def get_google_api_key_schema(hass: HomeAssistant) -> vol.Schema:
     """Return the static schema for Google API key configuration."""
     return vol.Schema(
@@ -351,6 +378,7 @@ async def get_google_api_key_schema(hass: HomeAssistant) -> vol.Schema:
     )
 
 
+@cached_schema
 async def get_google_places_schema(hass: HomeAssistant) -> vol.Schema:
     """Return the static schema for Google Places service configuration."""
     return vol.Schema(
@@ -416,6 +444,7 @@ async def get_google_places_schema(hass: HomeAssistant) -> vol.Schema:
     )
 
 
+@cached_schema
 async def get_google_routes_schema(hass: HomeAssistant) -> vol.Schema:
     """Return the static schema for Google Routes service configuration."""
     return vol.Schema(
@@ -442,6 +471,7 @@ async def get_google_routes_schema(hass: HomeAssistant) -> vol.Schema:
     )
 
 
+@cached_schema
 async def get_wikipedia_schema(hass: HomeAssistant) -> vol.Schema:
     """Return the static schema for Wikipedia service configuration."""
     return vol.Schema(
@@ -462,6 +492,7 @@ async def get_wikipedia_schema(hass: HomeAssistant) -> vol.Schema:
     )
 
 
+@cached_schema
 async def get_basic_utilities_schema(hass: HomeAssistant) -> vol.Schema:
     """Return the static schema for Basic Utilities tool configuration."""
     return vol.Schema(
@@ -834,10 +865,12 @@ class LlmIntentsOptionsFlow(config_entries.OptionsFlowWithReload):
         super().__init__()
         self._config_entry = config_entry
         self.user_selections: dict[str, Any] = {}
-        self.config_data = {
+        # Entry values used as form defaults; the entry does not change mid-flow
+        self._entry_defaults = {
             **self.config_entry.data,
             **(self.config_entry.options or {}),
         }
+        self.config_data = dict(self._entry_defaults)
 
     @property
     def config_entry(self) -> ConfigEntry:
@@ -927,9 +960,7 @@ class LlmIntentsOptionsFlow(config_entries.OptionsFlowWithReload):
         user_input: dict[str, Any] | None = None,
     ) -> FlowResult:
         """Handle the configure menu option."""
-        data = self.config_entry.data
-        opts = self.config_entry.options or {}
-        defaults = {**data, **opts}
+        defaults = self._entry_defaults
 
         if user_input is None:
             schema_dict = {
@@ -972,7 +1003,7 @@ class LlmIntentsOptionsFlow(config_entries.OptionsFlowWithReload):
     ) -> FlowResult:
         """Handle the current configuration step."""
         if user_input is None:
-            opts = {**self.config_entry.data, **(self.config_entry.options or {})}
+            opts = self._entry_defaults
             _, schema_func = SEARCH_STEP_ORDER[current_step]
             schema = await schema_func(self.hass)
             schema = self.add_suggested_values_to_schema(
@@ -988,7 +1019,7 @@ class LlmIntentsOptionsFlow(config_entries.OptionsFlowWithReload):
         merge_provider_api_keys_from_input(self.config_data, user_input)
 
         next_step = get_next_step(current_step, self.user_selections, SEARCH_STEP_ORDER)
-        opts = {**self.config_entry.data, **(self.config_entry.options or {})}
+        opts = self._entry_defaults
         if next_step:
             step_id, schema_func = next_step
             schema = await schema_func(self.hass)
@@ -1063,9 +1094,7 @@ class LlmIntentsOptionsFlow(config_entries.OptionsFlowWithReload):
         user_input: dict[str, Any] | None = None,
     ) -> FlowResult:
         """Handle the configure basic utilities menu option."""
-        data = self.config_entry.data
-        opts = self.config_entry.options or {}
-        defaults = {**data, **opts}
+        defaults = self._entry_defaults
 
         if user_input is None:
             schema = vol.Schema(
@@ -1106,7 +1135,7 @@ class LlmIntentsOptionsFlow(config_entries.OptionsFlowWithReload):
     ) -> FlowResult:
         """Handle Basic Utilities tool toggles step in options flow."""
         if user_input is None:
-            opts = {**self.config_entry.data, **(self.config_entry.options or {})}
+            opts = self._entry_defaults
             schema = await get_basic_utilities_schema(self.hass)
             schema = self.add_suggested_values_to_schema(schema, opts)
             return self.async_show_form(
@@ -1135,7 +1164,7 @@ class LlmIntentsOptionsFlow(config_entries.OptionsFlowWithReload):
     ) -> config_entries.FlowResult:
         """Handle Home Control (override Assist) configuration step in options flow."""
         if user_input is None:
-            opts = {**self.config_entry.data, **(self.config_entry.options or {})}
+            opts = self._entry_defaults
             base_schema = await get_home_control_schema(self.hass)
             schema = vol.Schema(
                 {
@@ -18,16 +18,18 @@ from custom_components.llm_intents.const import (
     CONF_BRAVE_TIMEZONE,
 )
 
-SEARCH_SCHEMA_KEYS = {
-    CONF_BRAVE_API_KEY,
-    CONF_BRAVE_NUM_RESULTS,
-    CONF_BRAVE_MAX_SNIPPETS_PER_URL,
-    CONF_BRAVE_COUNTRY_CODE,
-    CONF_BRAVE_LATITUDE,
-    CONF_BRAVE_LONGITUDE,
-    CONF_BRAVE_TIMEZONE,
-    CONF_BRAVE_POST_CODE,
-}
+SEARCH_SCHEMA_KEYS = frozenset(
+    {
+        CONF_BRAVE_API_KEY,
+        CONF_BRAVE_NUM_RESULTS,
+        CONF_BRAVE_MAX_SNIPPETS_PER_URL,
+        CONF_BRAVE_COUNTRY_CODE,
+        CONF_BRAVE_LATITUDE,
+        CONF_BRAVE_LONGITUDE,
+        CONF_BRAVE_TIMEZONE,
+        CONF_BRAVE_POST_CODE,
+    }
+)
 
 LLM_SCHEMA_KEYS = SEARCH_SCHEMA_KEYS | {
     CONF_BRAVE_MAX_TOKENS_PER_URL,
@@ -35,32 +37,19 @@ LLM_SCHEMA_KEYS = SEARCH_SCHEMA_KEYS | {
 }
 
 
-def _search_defaults(extra: dict | None = None) -> dict:
-    result = {
-        CONF_BRAVE_NUM_RESULTS: 2.0,
-        CONF_BRAVE_MAX_SNIPPETS_PER_URL: 2.0,
-        CONF_BRAVE_LATITUDE: None,
-        CONF_BRAVE_LONGITUDE: None,
-        CONF_BRAVE_POST_CODE: "",
-    }
-    if extra:
-        result.update(extra)
-    return result
-
+SEARCH_DEFAULTS = {
+    CONF_BRAVE_NUM_RESULTS: 2.0,
+    CONF_BRAVE_MAX_SNIPPETS_PER_URL: 2.0,
+    CONF_BRAVE_LATITUDE: None,
+    CONF_BRAVE_LONGITUDE: None,
+    CONF_BRAVE_POST_CODE: "",
+}
 
-def _llm_defaults(extra: dict | None = None) -> dict:
-    result = {
-        CONF_BRAVE_NUM_RESULTS: 2.0,
-        CONF_BRAVE_MAX_SNIPPETS_PER_URL: 2.0,
-        CONF_BRAVE_MAX_TOKENS_PER_URL: 1024.0,
-        CONF_BRAVE_CONTEXT_THRESHOLD_MODE: "balanced",
-        CONF_BRAVE_LATITUDE: None,
-        CONF_BRAVE_LONGITUDE: None,
-        CONF_BRAVE_POST_CODE: "",
-    }
-    if extra:
-        result.update(extra)
-    return result
+LLM_DEFAULTS = {
+    **SEARCH_DEFAULTS,
+    CONF_BRAVE_MAX_TOKENS_PER_URL: 1024.0,
+    CONF_BRAVE_CONTEXT_THRESHOLD_MODE: "balanced",
+}
 
 
 @pytest.mark.parametrize(
@@ -75,9 +64,9 @@ def _llm_defaults(extra: dict | None = None) -> dict:
             },
             {
                 CONF_BRAVE_API_KEY: "valid key",
-                **_search_defaults(
-                    {CONF_BRAVE_NUM_RESULTS: 5.0, CONF_BRAVE_MAX_SNIPPETS_PER_URL: 3.0}
-                ),
+                **SEARCH_DEFAULTS,
+                CONF_BRAVE_NUM_RESULTS: 5.0,
+                CONF_BRAVE_MAX_SNIPPETS_PER_URL: 3.0,
             },
         ),
         (
@@ -89,20 +78,20 @@ def _llm_defaults(extra: dict | None = None) -> dict:
             },
             {
                 CONF_BRAVE_API_KEY: "valid key",
-                **_llm_defaults(
-                    {CONF_BRAVE_NUM_RESULTS: 5.0, CONF_BRAVE_MAX_SNIPPETS_PER_URL: 3.0}
-                ),
+                **LLM_DEFAULTS,
+                CONF_BRAVE_NUM_RESULTS: 5.0,
+                CONF_BRAVE_MAX_SNIPPETS_PER_URL: 3.0,
             },
         ),
         (
             False,
             {CONF_BRAVE_API_KEY: "valid key"},
-            {CONF_BRAVE_API_KEY: "valid key", **_search_defaults()},
+            {CONF_BRAVE_API_KEY: "valid key", **SEARCH_DEFAULTS},
         ),
         (
             True,
             {CONF_BRAVE_API_KEY: "valid key"},
-            {CONF_BRAVE_API_KEY: "valid key", **_llm_defaults()},
+            {CONF_BRAVE_API_KEY: "valid key", **LLM_DEFAULTS},
         ),
         (
             False,
@@ -139,9 +128,9 @@ def _llm_defaults(extra: dict | None = None) -> dict:
             },
             {
                 CONF_BRAVE_API_KEY: "valid key",
-                **_search_defaults(
-                    {CONF_BRAVE_LATITUDE: 40.712, CONF_BRAVE_POST_CODE: "10001"}
-                ),
+                **SEARCH_DEFAULTS,
+                CONF_BRAVE_LATITUDE: 40.712,
+                CONF_BRAVE_POST_CODE: "10001",
             },
         ),
         (
@@ -153,12 +142,9 @@ def _llm_defaults(extra: dict | None = None) -> dict:
             },
             {
                 CONF_BRAVE_API_KEY: "valid key",
-                **_llm_defaults(
-                    {
-                        CONF_BRAVE_MAX_TOKENS_PER_URL: 2048.0,
-                        CONF_BRAVE_CONTEXT_THRESHOLD_MODE: "strict",
-                    }
-                ),
+                **LLM_DEFAULTS,
+                CONF_BRAVE_MAX_TOKENS_PER_URL: 2048.0,
+                CONF_BRAVE_CONTEXT_THRESHOLD_MODE: "strict",
             },
         ),
     ],
@@ -170,9 +156,9 @@ async def test_brave_schema_validation(
     expected: dict | type[vol.Invalid],
 ) -> None:
     """Parametrized test for brave schema validation."""
-    schema = await get_brave_schema(hass, is_llm_context_search)
+    schema = await get_brave_schema(hass, is_llm_context_search=is_llm_context_search)
     expected_keys = LLM_SCHEMA_KEYS if is_llm_context_search else SEARCH_SCHEMA_KEYS
-    assert set(schema.schema.keys()) == expected_keys
+    assert schema.schema.keys() == expected_keys
     if expected is vol.Invalid:
         with pytest.raises(vol.Invalid):
             schema(user_input)
@@ -0,0 +1,73 @@
+"""Tests for schema caching in config_flow."""
+
+from collections.abc import Awaitable, Callable
+
+import pytest
+import voluptuous as vol
+from homeassistant.core import HomeAssistant
+
+from custom_components.llm_intents.config_flow import (
+    STEP_USER_DATA_SCHEMA,
+    get_basic_utilities_schema,
+    get_brave_llm_schema,
+    get_brave_search_schema,
+    get_google_api_key_schema,
+    get_google_places_schema,
+    get_google_routes_schema,
+    get_searxng_schema,
+    get_weather_schema,
+    get_wikipedia_schema,
+)
+from custom_components.llm_intents.const import (
+    CONF_BASIC_UTILITIES_ENABLED,
+    CONF_GOOGLE_PLACES_ENABLED,
+    CONF_GOOGLE_ROUTES_ENABLED,
+    CONF_HOME_CONTROL_ENABLED,
+    CONF_WEATHER_ENABLED,
+    CONF_WIKIPEDIA_ENABLED,
+    CONF_YOUTUBE_ENABLED,
+)
+
+
+@pytest.mark.parametrize(
+    "schema_func",
+    [
+        get_brave_search_schema,
+        get_brave_llm_schema,
+        get_searxng_schema,
+        get_google_api_key_schema,
+        get_google_places_schema,
+        get_google_routes_schema,
+        get_wikipedia_schema,
+        get_basic_utilities_schema,
+    ],
+)
+async def test_static_schema_is_cached(
+    hass: HomeAssistant,
+    schema_func: Callable[[HomeAssistant], Awaitable[vol.Schema]],
+) -> None:
+    """Static schemas are built once and reused."""
+    assert await schema_func(hass) is await schema_func(hass)
+
+
+async def test_brave_schemas_are_cached_separately(hass: HomeAssistant) -> None:
+    """Brave search and LLM context schemas do not share a cache entry."""
+    assert await get_brave_search_schema(hass) is not await get_brave_llm_schema(hass)
+
+
+async def test_weather_schema_is_not_cached(hass: HomeAssistant) -> None:
+    """Schemas built from HA state are rebuilt on every call."""
+    assert await get_weather_schema(hass) is not await get_weather_schema(hass)
+
+
+def test_step_user_schema_defaults_services_off() -> None:
+    """The shared main menu schema leaves every service disabled by default."""
+    assert STEP_USER_DATA_SCHEMA({}) == {
+        CONF_GOOGLE_PLACES_ENABLED: False,
+        CONF_GOOGLE_ROUTES_ENABLED: False,
+        CONF_YOUTUBE_ENABLED: False,
+        CONF_WIKIPEDIA_ENABLED: False,
+        CONF_WEATHER_ENABLED: False,
+        CONF_BASIC_UTILITIES_ENABLED: False,
+        CONF_HOME_CONTROL_ENABLED: False,
+    }
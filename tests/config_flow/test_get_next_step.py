@@ -4,7 +4,6 @@ from collections.abc import Callable
 from typing import Any
 
 import pytest
-from homeassistant.core import HomeAssistant
 
 from custom_components.llm_intents.config_flow import (
     INITIAL_CONFIG_STEP_ORDER,
@@ -120,7 +119,7 @@ class TestGetNextStepInitialConfigOrder:
             ),
         ],
     )
-    async def test_get_next_step_initial_config_order(
+    def test_get_next_step_initial_config_order(
         self,
         current_step: str,
         config_data: dict[str, Any],
@@ -130,66 +129,57 @@ class TestGetNextStepInitialConfigOrder:
         result = get_next_step(current_step, config_data, INITIAL_CONFIG_STEP_ORDER)
         assert result == expected
 
-    async def test_get_next_step_all_services_enabled(
-        self, hass: HomeAssistant
-    ) -> None:
-        """Walk through all steps when every service is enabled."""
-        config_data = {
-            CONF_SEARCH_PROVIDER: CONF_SEARCH_PROVIDER_BRAVE,
-            CONF_GOOGLE_PLACES_ENABLED: True,
-            CONF_GOOGLE_ROUTES_ENABLED: True,
-            CONF_WIKIPEDIA_ENABLED: True,
-            CONF_WEATHER_ENABLED: True,
-            CONF_BASIC_UTILITIES_ENABLED: True,
-            CONF_HOME_CONTROL_ENABLED: True,
-        }
-
-        expected_steps = [
-            (STEP_BRAVE, get_brave_search_schema),
-            (STEP_GOOGLE_API_KEY, get_google_api_key_schema),
-            (STEP_GOOGLE_PLACES, get_google_places_schema),
-            (STEP_GOOGLE_ROUTES, get_google_routes_schema),
-            (STEP_WIKIPEDIA, get_wikipedia_schema),
-            (STEP_WEATHER, get_weather_schema),
-            (STEP_BASIC_UTILITIES, get_basic_utilities_schema),
-            (STEP_HOME_CONTROL, get_home_control_schema),
-        ]
-
-        # Walk the flow from STEP_USER, collecting each next_step result
-        steps: list[tuple[str, Callable] | None] = []
-        current_step: str = STEP_USER
-        while True:
-            result = get_next_step(current_step, config_data, INITIAL_CONFIG_STEP_ORDER)
-            steps.append(result)
-            if result is None:
-                break
-            current_step = result[0]
-
-        assert len([s for s in steps if s is not None]) == len(expected_steps)
-        assert steps[-1] is None
-        assert steps == [*expected_steps, None]
-
-    async def test_get_next_step_some_services_disabled(
-        self, hass: HomeAssistant
+    @pytest.mark.parametrize(
+        ("config_data", "expected_steps"),
+        [
+            # Every service enabled
+            (
+                {
+                    CONF_SEARCH_PROVIDER: CONF_SEARCH_PROVIDER_BRAVE,
+                    CONF_GOOGLE_PLACES_ENABLED: True,
+                    CONF_GOOGLE_ROUTES_ENABLED: True,
+                    CONF_WIKIPEDIA_ENABLED: True,
+                    CONF_WEATHER_ENABLED: True,
+                    CONF_BASIC_UTILITIES_ENABLED: True,
+                    CONF_HOME_CONTROL_ENABLED: True,
+                },
+                [
+                    (STEP_BRAVE, get_brave_search_schema),
+                    (STEP_GOOGLE_API_KEY, get_google_api_key_schema),
+                    (STEP_GOOGLE_PLACES, get_google_places_schema),
+                    (STEP_GOOGLE_ROUTES, get_google_routes_schema),
+                    (STEP_WIKIPEDIA, get_wikipedia_schema),
+                    (STEP_WEATHER, get_weather_schema),
+                    (STEP_BASIC_UTILITIES, get_basic_utilities_schema),
+                    (STEP_HOME_CONTROL, get_home_control_schema),
+                ],
+            ),
+            # Some services disabled
+            (
+                {
+                    CONF_SEARCH_PROVIDER: CONF_SEARCH_PROVIDER_SEARXNG,
+                    CONF_GOOGLE_PLACES_ENABLED: False,
+                    CONF_GOOGLE_ROUTES_ENABLED: False,
+                    CONF_WIKIPEDIA_ENABLED: True,
+                    CONF_WEATHER_ENABLED: False,
+                    CONF_BASIC_UTILITIES_ENABLED: True,
+                    CONF_HOME_CONTROL_ENABLED: True,
+                },
+                [
+                    (STEP_SEARXNG, get_searxng_schema),
+                    (STEP_WIKIPEDIA, get_wikipedia_schema),
+                    (STEP_BASIC_UTILITIES, get_basic_utilities_schema),
+                    (STEP_HOME_CONTROL, get_home_control_schema),
+                ],
+            ),
+        ],
+    )
+    def test_get_next_step_walk(
+        self,
+        config_data: dict[str, Any],
+        expected_steps: list[tuple[str, Callable]],
     ) -> None:
-        """Walk through steps when some services are disabled."""
-        config_data = {
-            CONF_SEARCH_PROVIDER: CONF_SEARCH_PROVIDER_SEARXNG,
-            CONF_GOOGLE_PLACES_ENABLED: False,
-            CONF_GOOGLE_ROUTES_ENABLED: False,
-            CONF_WIKIPEDIA_ENABLED: True,
-            CONF_WEATHER_ENABLED: False,
-            CONF_BASIC_UTILITIES_ENABLED: True,
-            CONF_HOME_CONTROL_ENABLED: True,
-        }
-
-        expected_steps = [
-            (STEP_SEARXNG, get_searxng_schema),
-            (STEP_WIKIPEDIA, get_wikipedia_schema),
-            (STEP_BASIC_UTILITIES, get_basic_utilities_schema),
-            (STEP_HOME_CONTROL, get_home_control_schema),
-        ]
-
+        """Walk through every step of the flow for the selected services."""
         # Walk the flow from STEP_USER, collecting each next_step result
         steps: list[tuple[str, Callable] | None] = []
         current_step: str = STEP_USER
@@ -0,0 +1,30 @@
+"""Shared fixtures for the Google tool tests."""
+
+from collections.abc import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.llm_intents.const import DOMAIN
+
+
+@pytest.fixture
+def configured_hass(hass: HomeAssistant, config: dict) -> HomeAssistant:
+    """Attach the test module's config and a config entry to hass."""
+    hass.data = {DOMAIN: {"config": config}}
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    return hass
+
+
+@pytest.fixture
+def cache_miss() -> Iterator[Mock]:
+    """Patch SQLiteCache in the Google tools so every lookup is a miss."""
+    with (
+        patch("custom_components.llm_intents.google_routes.SQLiteCache") as cache_cls,
+        patch("custom_components.llm_intents.google_places.SQLiteCache", cache_cls),
+    ):
+        cache_cls.return_value.get.return_value = None
+        yield cache_cls
@@ -0,0 +1,208 @@
+"""Tests for the Google Places tool."""
+
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import llm
+
+from custom_components.llm_intents.const import (
+    CONF_GOOGLE_PLACES_LATITUDE,
+    CONF_GOOGLE_PLACES_LONGITUDE,
+    CONF_GOOGLE_PLACES_NUM_RESULTS,
+    CONF_GOOGLE_PLACES_RADIUS,
+    CONF_PROVIDER_API_KEYS,
+    PROVIDER_GOOGLE,
+)
+from custom_components.llm_intents.google_places import FindPlacesTool
+
+from .utils import MockContext, mock_response
+
+PLACES_URL = "https://places.googleapis.com/v1/places:searchText"
+
+
+def _respond(status: int, data: dict) -> Callable[..., MockContext]:
+    """Build a POST side effect that returns a single response."""
+    return lambda *_args, **_kwargs: MockContext(mock_response(status, data))
+
+
+def _tool_input(query: str = "coffee") -> llm.ToolInput:
+    return llm.ToolInput(tool_name=FindPlacesTool.name, tool_args={"query": query})
+
+
+@pytest.fixture
+def config() -> dict:
+    """Default places config."""
+    return {
+        CONF_PROVIDER_API_KEYS: {PROVIDER_GOOGLE: "test_google_key"},
+        CONF_GOOGLE_PLACES_NUM_RESULTS: 2,
+    }
+
+
+@pytest.fixture
+def session() -> Any:
+    """Patch the client session used by the tool."""
+    with patch(
+        "custom_components.llm_intents.google_places.async_get_clientsession",
+    ) as get_session:
+        yield get_session.return_value
+
+
+@pytest.mark.parametrize(
+    ("places", "expected_results"),
+    [
+        (
+            [
+                {
+                    "displayName": {"text": "Test Cafe"},
+                    "shortFormattedAddress": "1 Test St",
+                    "rating": 4.5,
+                    "nationalPhoneNumber": "555 0100",
+                    "regularOpeningHours": {
+                        "openNow": True,
+                        "weekdayDescriptions": ["Monday:\u20097\u202fAM"],
+                    },
+                },
+            ],
+            [
+                {
+                    "name": "Test Cafe",
+                    "address": "1 Test St",
+                    "rating": "4.5 out of 5",
+                    "phone": "555 0100",
+                    "open_now": True,
+                    "regular_open_hours": ["Monday: 7 AM"],
+                },
+            ],
+        ),
+        (
+            [{}],
+            [
+                {
+                    "name": None,
+                    "address": None,
+                    "rating": "Not rated",
+                    "phone": "Not available",
+                },
+            ],
+        ),
+    ],
+)
+async def test_returns_formatted_places(
+    tool: FindPlacesTool,
+    configured_hass: HomeAssistant,
+    session: Mock,
+    cache_miss: Any,
+    places: list[dict],
+    expected_results: list[dict],
+) -> None:
+    """Places are flattened into results and cached."""
+    session.post.side_effect = _respond(200, {"places": places})
+
+    result = await tool.async_call(configured_hass, _tool_input(), Mock())
+
+    assert result == {
+        "results": expected_results,
+        "instruction": tool.response_directive,
+    }
+    cache_miss.return_value.set.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("status", "data", "expected"),
+    [
+        (200, {"places": []}, {"result": "No places found"}),
+        (200, {}, {"result": "No places found"}),
+        (500, {}, {"error": "Places search error: 500"}),
+    ],
+)
+async def test_returns_message_without_results(
+    tool: FindPlacesTool,
+    configured_hass: HomeAssistant,
+    session: Mock,
+    cache_miss: Any,
+    status: int,
+    data: dict,
+    expected: dict,
+) -> None:
+    """Empty or failed searches are reported and not cached."""
+    session.post.side_effect = _respond(status, data)
+
+    result = await tool.async_call(configured_hass, _tool_input(), Mock())
+
+    assert result == expected
+    cache_miss.return_value.set.assert_not_called()
+
+
+async def test_returns_error_without_api_key(
+    tool: FindPlacesTool,
+    configured_hass: HomeAssistant,
+    config: dict,
+) -> None:
+    """Missing Google API key surfaces a clear error."""
+    config[CONF_PROVIDER_API_KEYS] = {}
+    result = await tool.async_call(configured_hass, _tool_input(), Mock())
+    assert result == {"error": "Google Places API key not configured"}
+
+
+async def test_returns_error_on_exception(
+    tool: FindPlacesTool,
+    configured_hass: HomeAssistant,
+    session: Mock,
+    cache_miss: Any,
+) -> None:
+    """Unexpected errors are caught and reported."""
+    session.post.side_effect = RuntimeError("boom")
+
+    result = await tool.async_call(configured_hass, _tool_input(), Mock())
+
+    assert result == {"error": "Error finding places: boom"}
+
+
+async def test_request_includes_location_bias(
+    tool: FindPlacesTool,
+    configured_hass: HomeAssistant,
+    config: dict,
+    session: Mock,
+    cache_miss: Any,
+) -> None:
+    """Configured coordinates are sent as a location bias circle."""
+    config[CONF_GOOGLE_PLACES_LATITUDE] = -27.5
+    config[CONF_GOOGLE_PLACES_LONGITUDE] = 153.0
+    config[CONF_GOOGLE_PLACES_RADIUS] = 5
+    session.post.side_effect = _respond(200, {"places": []})
+
+    await tool.async_call(configured_hass, _tool_input("pizza"), Mock())
+
+    call = session.post.call_args
+    assert call.args[0] == PLACES_URL
+    assert call.kwargs["headers"]["X-Goog-Api-Key"] == "test_google_key"
+    body = call.kwargs["json"]
+    assert body["textQuery"] == "pizza"
+    assert body["pageSize"] == 2
+    assert body["locationBias"] == {
+        "circle": {
+            "center": {"latitude": -27.5, "longitude": 153.0},
+            "radius": 5000,
+        },
+    }
+
+
+async def test_cache_hit_skips_request(
+    tool: FindPlacesTool,
+    configured_hass: HomeAssistant,
+    session: Mock,
+) -> None:
+    """A cached response is returned without calling the Places API."""
+    cached = {"results": [{"name": "Cached Cafe"}]}
+
+    with patch(
+        "custom_components.llm_intents.google_places.SQLiteCache",
+    ) as cache_cls:
+        cache_cls.return_value.get.return_value = cached
+        result = await tool.async_call(configured_hass, _tool_input(), Mock())
+
+    assert result == cached
+    session.post.assert_not_called()
@@ -2,19 +2,18 @@
 
 from datetime import UTC, datetime
 from typing import Any
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 from freezegun import freeze_time
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import llm
 from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
-from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.llm_intents.const import (
     CONF_GOOGLE_ROUTES_DEFAULT_TRAVEL_MODE,
     CONF_GOOGLE_ROUTES_HOME_ADDRESS,
     CONF_PROVIDER_API_KEYS,
-    DOMAIN,
     PROVIDER_GOOGLE,
 )
 from custom_components.llm_intents.google_routes import (
@@ -23,7 +22,7 @@ from custom_components.llm_intents.google_routes import (
     _format_duration,
 )
 
-from .utils import MockContext
+from .utils import MockContext, mock_response
 
 PLACES_URL = "https://places.googleapis.com/v1/places:searchText"
 ROUTES_URL = "https://routes.googleapis.com/directions/v2:computeRoutes"
@@ -51,26 +50,20 @@ def _routes_response(
     }
 
 
-def _make_session(responses_by_url: dict[str, dict]) -> AsyncMock:
+def _make_session(responses_by_url: dict[str, dict]) -> Mock:
     """Build a mock session that dispatches POST responses by URL."""
-    session = AsyncMock()
+    session = Mock()
 
     def mock_post(url: str, **_kwargs: Any) -> MockContext:
         body = responses_by_url[url]
-        response = AsyncMock()
-        response.status = body["status"]
-        response.json = AsyncMock(return_value=body["data"])
-        response.text = AsyncMock(return_value=str(body.get("data")))
-        return MockContext(response)
+        return MockContext(mock_response(body["status"], body["data"]))
 
     session.post = Mock(side_effect=mock_post)
     return session
 
 
-def _tool_input(**args: Any) -> Mock:
-    tool_input = Mock()
-    tool_input.tool_args = args
-    return tool_input
+def _tool_input(**args: Any) -> llm.ToolInput:
+    return llm.ToolInput(tool_name=GetRouteTool.name, tool_args=args)
 
 
 @pytest.fixture
@@ -84,11 +77,9 @@ def config() -> dict:
 
 
 @pytest.fixture
-def routes_hass(hass: HomeAssistant, config: dict) -> HomeAssistant:
-    """Configure a mock HA instance for the routes tool."""
-    hass.data = {DOMAIN: {"config": config}}
-    entry = MockConfigEntry(domain=DOMAIN)
-    entry.add_to_hass(hass)
+def routes_hass(configured_hass: HomeAssistant) -> HomeAssistant:
+    """Configure hass for the routes tool."""
+    hass = configured_hass
     # `hass.config` is not a class attribute on the HA spec, so attach our own.
     hass.config = Mock()
     hass.config.language = "en"
@@ -105,16 +96,6 @@ def tool(routes_hass: HomeAssistant, config: dict) -> GetRouteTool:
     return GetRouteTool(config, routes_hass)
 
 
-@pytest.fixture
-def cache_miss() -> Any:
-    """Patch SQLiteCache so every lookup is a miss."""
-    with patch(
-        "custom_components.llm_intents.google_routes.SQLiteCache",
-    ) as cache_cls:
-        cache_cls.return_value.get.return_value = None
-        yield cache_cls
-
-
 @pytest.mark.parametrize(
     ("seconds", "expected"),
     [
@@ -144,34 +125,33 @@ def test_format_distance(metres: int, imperial: bool, expected: str) -> None:
     assert _format_distance(metres, imperial=imperial) == expected
 
 
-async def test_returns_error_without_api_key(
-    tool: GetRouteTool,
-    routes_hass: HomeAssistant,
-    config: dict,
-) -> None:
-    """Missing Google API key surfaces a clear error."""
-    config[CONF_PROVIDER_API_KEYS] = {}
-    result = await tool.async_call(
-        routes_hass,
-        _tool_input(destination="anywhere"),
-        Mock(),
-    )
-    assert result == {"error": "Google API key not configured"}
-
-
-async def test_returns_error_without_home_address(
+@pytest.mark.parametrize(
+    ("key", "value", "expected_error"),
+    [
+        (CONF_PROVIDER_API_KEYS, {}, "Google API key not configured"),
+        (
+            CONF_GOOGLE_ROUTES_HOME_ADDRESS,
+            "",
+            "Home address for Routes is not configured",
+        ),
+    ],
+)
+async def test_returns_error_when_misconfigured(
     tool: GetRouteTool,
     routes_hass: HomeAssistant,
     config: dict,
+    key: str,
+    value: Any,
+    expected_error: str,
 ) -> None:
-    """Missing home address surfaces a clear error."""
-    config[CONF_GOOGLE_ROUTES_HOME_ADDRESS] = ""
+    """Missing API key or home address surfaces a clear error."""
+    config[key] = value
     result = await tool.async_call(
         routes_hass,
         _tool_input(destination="anywhere"),
         Mock(),
     )
-    assert result == {"error": "Home address for Routes is not configured"}
+    assert result == {"error": expected_error}
 
 
 async def test_resolves_via_places_then_routes(
@@ -571,20 +551,14 @@ async def test_resolve_destination_via_places(
     expected: dict | None,
 ) -> None:
     """Resolve destination via Places API with caching and error handling."""
-    session = AsyncMock()
+    session = Mock()
 
     def mock_post(url: str, **_kwargs: Any) -> MockContext:
         if "places" in url:
             if raise_on_places:
                 raise RuntimeError("network error")
-            response = AsyncMock()
-            response.status = 200
-            response.json = AsyncMock(return_value=places_response or {})
-            return MockContext(response)
-        response = AsyncMock()
-        response.status = 200
-        response.json = AsyncMock(return_value=_routes_response())
-        return MockContext(response)
+            return MockContext(mock_response(200, places_response or {}))
+        return MockContext(mock_response(200, _routes_response()))
 
     session.post = Mock(side_effect=mock_post)
 
@@ -632,20 +606,14 @@ async def test_async_call_variants(
     raise_on_routes: bool,
 ) -> None:
     """Test async_call with departure time, no routes, and exception paths."""
-    session = AsyncMock()
+    session = Mock()
 
     def mock_post(url: str, **_kwargs: Any) -> MockContext:
         if "places" in url:
-            response = AsyncMock()
-            response.status = 200
-            response.json = AsyncMock(return_value=_places_response())
-            return MockContext(response)
+            return MockContext(mock_response(200, _places_response()))
         if raise_on_routes:
             raise RuntimeError("api error")
-        response = AsyncMock()
-        response.status = 200
-        response.json = AsyncMock(return_value=routes_response)
-        return MockContext(response)
+        return MockContext(mock_response(200, routes_response))
 
     session.post = Mock(side_effect=mock_post)
 
@@ -1,13 +1,11 @@
 """Tests for HomeControlAPI."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import llm
-from homeassistant.helpers.area_registry import AreaEntry, AreaRegistry
-from homeassistant.helpers.device_registry import DeviceEntry, DeviceRegistry
-from homeassistant.helpers.floor_registry import FloorEntry, FloorRegistry
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.llm_intents.const import (
@@ -35,18 +33,22 @@ def config_entry() -> MockConfigEntry:
 
 @pytest.fixture
 def mock_llm_context_no_device() -> llm.LLMContext:
-    """Mock LLMContext without device_id."""
-    context = MagicMock(spec=llm.LLMContext)
-    context.device_id = None
-    return context
+    """LLMContext without device_id."""
+    return llm.LLMContext(
+        platform="test", context=None, language="en", assistant=None, device_id=None
+    )
 
 
 @pytest.fixture
 def mock_llm_context_with_device() -> llm.LLMContext:
-    """Mock LLMContext with device_id."""
-    context = MagicMock(spec=llm.LLMContext)
-    context.device_id = "device_123"
-    return context
+    """LLMContext with device_id."""
+    return llm.LLMContext(
+        platform="test",
+        context=None,
+        language="en",
+        assistant=None,
+        device_id="device_123",
+    )
 
 
 async def test_get_tools_filters_disabled_tools(
@@ -102,27 +104,15 @@ async def test_async_get_api_prompt_generates_correct_prompt(
         "switch.garage": {"entity_id": "switch.garage", "names": "Garage Switch"},
     }
 
-    # Mock device, area, and floor registry lookups
-    device = MagicMock(spec=DeviceEntry)
-    device.area_id = "area_1"
-
-    device_reg = MagicMock(spec=DeviceRegistry)
-    device_reg.async_get = MagicMock(return_value=device)
-
-    area = MagicMock(spec=AreaEntry)
-    area.id = "area_1"
-    area.floor_id = "floor_1"
-    area.name = "Living Room"
-
-    area_reg = MagicMock(spec=AreaRegistry)
-    area_reg.async_get_area = MagicMock(return_value=area)
+    # Stub device, area, and floor registry lookups
+    device = SimpleNamespace(area_id="area_1")
+    device_reg = SimpleNamespace(async_get=lambda _: device)
 
-    floor = MagicMock(spec=FloorEntry)
-    floor.floor_id = "floor_1"
-    floor.name = "Upstairs"
+    area = SimpleNamespace(id="area_1", floor_id="floor_1", name="Living Room")
+    area_reg = SimpleNamespace(async_get_area=lambda _: area)
 
-    floor_reg = MagicMock(spec=FloorRegistry)
-    floor_reg.async_get_floor = MagicMock(return_value=floor)
+    floor = SimpleNamespace(floor_id="floor_1", name="Upstairs")
+    floor_reg = SimpleNamespace(async_get_floor=lambda _: floor)
 
     with (
         patch(
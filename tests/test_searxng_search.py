@@ -133,16 +133,14 @@ async def test_searxng_search_cleanup_text_called(
 ) -> None:
     """Test that cleanup_text is called on each result content."""
     mock_cleanup = AsyncMock(side_effect=lambda x: x)
+    tool.cleanup_text = mock_cleanup
 
-    with (
-        patch(
-            "custom_components.llm_intents.searxng_search.async_get_clientsession",
-            return_value=mock_session(
-                status=200,
-                data=success_response,
-            ),
+    with patch(
+        "custom_components.llm_intents.searxng_search.async_get_clientsession",
+        return_value=mock_session(
+            status=200,
+            data=success_response,
         ),
-        patch.object(tool, "cleanup_text", mock_cleanup),
     ):
         await tool.async_search("test query")
 
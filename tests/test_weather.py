@@ -28,6 +28,18 @@ def tool(hass: HomeAssistant) -> WeatherForecastTool:
     return WeatherForecastTool({}, hass)
 
 
+@pytest.fixture
+def llm_context() -> llm.LLMContext:
+    """Return an LLMContext without a device."""
+    return llm.LLMContext(
+        platform="test",
+        context=None,
+        language="en",
+        assistant=None,
+        device_id=None,
+    )
+
+
 @pytest.mark.parametrize(
     ("precipitation_chance", "expected"),
     [
@@ -334,7 +346,6 @@ def test_get_current_temperature_sensor_data(
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_get_daily_forecast_with_target_date(
     tool: WeatherForecastTool, hass: HomeAssistant
 ) -> None:
@@ -379,7 +390,6 @@ async def test_get_daily_forecast_with_target_date(
     assert "Precipitation: moderate" in result
 
 
-@pytest.mark.asyncio
 async def test_get_daily_forecast_without_target_date(
     tool: WeatherForecastTool, hass: HomeAssistant
 ) -> None:
@@ -419,7 +429,6 @@ async def test_get_daily_forecast_without_target_date(
     assert "Partly Cloudy" in result
 
 
-@pytest.mark.asyncio
 async def test_get_daily_forecast_no_forecast(
     tool: WeatherForecastTool, hass: HomeAssistant
 ) -> None:
@@ -444,7 +453,6 @@ async def test_get_daily_forecast_no_forecast(
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_get_twice_daily_forecast(
     tool: WeatherForecastTool, hass: HomeAssistant
 ) -> None:
@@ -492,7 +500,6 @@ async def test_get_twice_daily_forecast(
     assert "Clear" in result
 
 
-@pytest.mark.asyncio
 async def test_get_twice_daily_forecast_no_twice_daily_support(
     tool: WeatherForecastTool, hass: HomeAssistant
 ) -> None:
@@ -529,7 +536,6 @@ async def test_get_twice_daily_forecast_no_twice_daily_support(
     assert "Sunny" in result
 
 
-@pytest.mark.asyncio
 async def test_get_twice_daily_forecast_no_forecast(
     tool: WeatherForecastTool, hass: HomeAssistant
 ) -> None:
@@ -554,7 +560,6 @@ async def test_get_twice_daily_forecast_no_forecast(
 # =============================================================================
 
 
-@pytest.mark.asyncio
 async def test_get_hourly_forecast(
     tool: WeatherForecastTool,
     hass: HomeAssistant,
@@ -635,7 +640,6 @@ async def test_get_hourly_forecast(
         assert result.count("- Time:") == 4
 
 
-@pytest.mark.asyncio
 async def test_get_hourly_forecast_no_forecast(
     tool: WeatherForecastTool, hass: HomeAssistant
 ) -> None:
@@ -661,10 +665,11 @@ async def test_get_hourly_forecast_no_forecast(
 # =============================================================================
 
 
-@pytest.mark.asyncio
 @pytest.mark.freeze_time("2026-05-03")
 async def test_async_call_daily_forecast(
-    tool: WeatherForecastTool, hass: HomeAssistant
+    tool: WeatherForecastTool,
+    hass: HomeAssistant,
+    llm_context: llm.LLMContext,
 ) -> None:
     """Test async_call with daily forecast."""
     tool_input = llm.ToolInput(
@@ -712,16 +717,18 @@ async def test_async_call_daily_forecast(
     result = await tool.async_call(
         hass,
         tool_input,
-        MagicMock(spec=llm.LLMContext),
+        llm_context,
     )
 
     assert "Sunny" in result
     assert "Precipitation: possible" in result  # 30% is "possible"
 
 
-@pytest.mark.asyncio
 @pytest.mark.freeze_time("2026-05-03")
-async def test_async_call_with_temperature_sensor(hass: HomeAssistant) -> None:
+async def test_async_call_with_temperature_sensor(
+    hass: HomeAssistant,
+    llm_context: llm.LLMContext,
+) -> None:
     """Test async_call with current temperature sensor included."""
     tool = WeatherForecastTool(
         {
@@ -773,7 +780,7 @@ async def test_async_call_with_temperature_sensor(hass: HomeAssistant) -> None:
     result = await tool.async_call(
         hass,
         tool_input,
-        MagicMock(spec=llm.LLMContext),
+        llm_context,
     )
 
     assert "current" in result
@@ -789,9 +796,10 @@ async def test_async_call_with_temperature_sensor(hass: HomeAssistant) -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_async_call_no_forecast_available(
-    tool: WeatherForecastTool, hass: HomeAssistant
+    tool: WeatherForecastTool,
+    hass: HomeAssistant,
+    llm_context: llm.LLMContext,
 ) -> None:
     """Test async_call when no forecast is available."""
     tool_input = llm.ToolInput(
@@ -824,16 +832,17 @@ async def test_async_call_no_forecast_available(
     result = await tool.async_call(
         hass,
         tool_input,
-        MagicMock(spec=llm.LLMContext),
+        llm_context,
     )
 
     # When forecast retrieval fails, return error message
     assert "Error retrieving weather forecast" in result.get("error", "")
 
 
-@pytest.mark.asyncio
 async def test_async_call_error_handling(
-    tool: WeatherForecastTool, hass: HomeAssistant
+    tool: WeatherForecastTool,
+    hass: HomeAssistant,
+    llm_context: llm.LLMContext,
 ) -> None:
     """Test async_call error handling."""
     tool_input = llm.ToolInput(
@@ -862,7 +871,7 @@ async def test_async_call_error_handling(
     result = await tool.async_call(
         hass,
         tool_input,
-        MagicMock(spec=llm.LLMContext),
+        llm_context,
     )
 
     assert "error" in result
@@ -876,10 +885,11 @@ def test_format_date_returns_today() -> None:
     assert result == "Today (Thursday)"
 
 
-@pytest.mark.asyncio
 @pytest.mark.freeze_time("2026-05-03")
 async def test_async_call_twice_daily_forecast(
-    tool: WeatherForecastTool, hass: HomeAssistant
+    tool: WeatherForecastTool,
+    hass: HomeAssistant,
+    llm_context: llm.LLMContext,
 ) -> None:
     """Test async_call takes the twice-daily forecast path."""
     tool_input = llm.ToolInput(
@@ -932,7 +942,7 @@ async def test_async_call_twice_daily_forecast(
     result = await tool.async_call(
         hass,
         tool_input,
-        MagicMock(spec=llm.LLMContext),
+        llm_context,
     )
 
     assert "daytime" in result
@@ -941,9 +951,10 @@ async def test_async_call_twice_daily_forecast(
     assert "Clear" in result
 
 
-@pytest.mark.asyncio
 async def test_async_call_no_forecast_fallback(
-    tool: WeatherForecastTool, hass: HomeAssistant
+    tool: WeatherForecastTool,
+    hass: HomeAssistant,
+    llm_context: llm.LLMContext,
 ) -> None:
     """Test async_call returns fallback message when no forecast is available."""
     tool_input = llm.ToolInput(
@@ -962,7 +973,7 @@ async def test_async_call_no_forecast_fallback(
     result = await tool.async_call(
         hass,
         tool_input,
-        MagicMock(spec=llm.LLMContext),
+        llm_context,
     )
 
     assert result == "No weather forecast available for the selected range"
@@ -6,7 +6,28 @@ contain test cases itself.
 """
 
 from typing import Any
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import Mock
+
+
+class MockResponse:
+    """
+    Minimal stand-in for an aiohttp client response.
+
+    A plain class rather than AsyncMock, as tests only read the status and body.
+    """
+
+    def __init__(self, status: int, data: Any) -> None:
+        """Initialize with a status code and JSON body."""
+        self.status = status
+        self._data = data
+
+    async def json(self) -> Any:
+        """Return the JSON body."""
+        return self._data
+
+    async def text(self) -> str:
+        """Return the body as text."""
+        return str(self._data)
 
 
 class MockContext:
@@ -16,11 +37,11 @@ class MockContext:
     Used to simulate aiohttp's async with statement pattern for HTTP requests.
     """
 
-    def __init__(self, response: AsyncMock) -> None:
+    def __init__(self, response: MockResponse) -> None:
         """Initialize with a response object."""
         self.response = response
 
-    async def __aenter__(self) -> AsyncMock:
+    async def __aenter__(self) -> MockResponse:
         """Return the response when entering the context."""
         return self.response
 
@@ -28,9 +49,9 @@ class MockContext:
         """Clean up when exiting the context."""
 
 
-def mock_session(status: int, data: dict) -> AsyncMock:
+def mock_session(status: int, data: dict) -> Mock:
     """Create a mock HTTP session."""
-    session = AsyncMock()
+    session = Mock()
 
     def mock_get(*args: object, **kwargs: Any) -> MockContext:
         return MockContext(mock_response(status, data))
@@ -39,9 +60,6 @@ def mock_session(status: int, data: dict) -> AsyncMock:
     return session
 
 
-def mock_response(status: int, data: dict) -> AsyncMock:
+def mock_response(status: int, data: dict) -> MockResponse:
     """Create a mock HTTP response."""
-    response = AsyncMock()
-    response.status = status
-    response.json = AsyncMock(return_value=data)
-    return response
+    return MockResponse(status, data)